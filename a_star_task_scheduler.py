@@ -1,7 +1,24 @@
 import heapq
-from typing import List, Dict, Tuple, Set
+import numbers
+from collections import deque
+from typing import List, Dict, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the pure Python path
+    njit = None
+
+try:
+    # Ahead-of-time compiled core, built with `python setup.py build_ext --inplace`
+    from scheduler_core import schedule as _critical_path_schedule_ext
+except ImportError:
+    _critical_path_schedule_ext = None
 
 class Task:
+    __slots__ = ("name", "duration", "dependencies", "start_time", "end_time")
+    
     def __init__(self, name: str, duration: int, dependencies: List[str] = None):
         self.name = name
         self.duration = duration
@@ -13,6 +30,41 @@ class AStarTaskScheduler:
     def __init__(self, tasks: List[Task]):
         self.tasks = {task.name: task for task in tasks}
         self.dependency_graph = self._build_dependency_graph()
+        
+        # Structure-of-arrays view of the tasks, indexed by task id
+        self._names = list(self.tasks)
+        self._ids = {task_name: i for i, task_name in enumerate(self._names)}
+        durations = [task.duration for task in self.tasks.values()]
+        # The compiled kernels work in int64, which only covers integer
+        # durations whose sums cannot overflow; anything else (floats, huge
+        # ints) keeps its Python values and runs on the pure Python paths
+        self._int64_durations = (
+            all(isinstance(duration, numbers.Integral) for duration in durations)
+            and sum(abs(duration) for duration in durations) <= np.iinfo(np.int64).max
+        )
+        self._durations = np.array(
+            durations, dtype=np.int64 if self._int64_durations else object
+        )
+        self._name_rank = np.empty(len(self._names), dtype=np.int64)
+        self._name_rank[sorted(range(len(self._names)), key=self._names.__getitem__)] = (
+            np.arange(len(self._names))
+        )
+        
+        # Dependency edges as parallel id arrays; dependents in CSR form
+        dependents = np.array(
+            [self._ids[task_name] for task_name, task in self.tasks.items() for _ in task.dependencies],
+            dtype=np.int32
+        )
+        dependencies = np.array(
+            [self._ids[dep] for task in self.tasks.values() for dep in task.dependencies],
+            dtype=np.int32
+        )
+        self._child_indptr, self._child_indices = self._build_csr(dependencies, dependents)
+        self._indegree = np.bincount(dependents, minlength=len(self._names)).astype(np.int32)
+        # Raises ValueError on circular dependencies, so every schedule
+        # path below can assume the graph is acyclic
+        self._topo_order = self._topological_order()
+        self._cp_length = self._calculate_critical_paths()
     
     def _build_dependency_graph(self) -> Dict[str, List[str]]:
         """Build a comprehensive dependency graph."""
@@ -22,110 +74,316 @@ class AStarTaskScheduler:
                 graph[dep].append(task_name)
         return graph
     
-    def _calculate_total_remaining_time(self, scheduled_tasks: Set[str]) -> int:
+    def _build_csr(self, sources: np.ndarray, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Encode the edges `sources[k] -> targets[k]` as CSR arrays: the targets
+        of task `i` are `indices[indptr[i]:indptr[i + 1]]`, in edge order.
+        """
+        indptr = np.zeros(len(self._names) + 1, dtype=np.int32)
+        np.add.at(indptr, sources + 1, 1)
+        np.cumsum(indptr, out=indptr)
+        indices = targets[np.argsort(sources, kind="stable")]
+        return indptr, indices
+    
+    def _topological_order(self) -> List[int]:
         """
-        Advanced heuristic calculation:
-        1. Estimate total remaining task time
-        2. Consider critical path
-        3. Penalize unscheduled dependent tasks
+        Order task ids so that every task comes after its dependencies,
+        using Kahn's algorithm (no recursion, so deep chains are safe).
         """
-        unscheduled_tasks = set(self.tasks.keys()) - scheduled_tasks
+        indptr = self._child_indptr.tolist()
+        indices = self._child_indices.tolist()
+        indegree = self._indegree.tolist()
+        queue = deque(task_id for task_id, count in enumerate(indegree) if count == 0)
+        order: List[int] = []
         
-        # Calculate remaining time
-        remaining_time = sum(
-            self.tasks[task].duration 
-            for task in unscheduled_tasks
-        )
+        while queue:
+            task_id = queue.popleft()
+            order.append(task_id)
+            for k in range(indptr[task_id], indptr[task_id + 1]):
+                child = indices[k]
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    queue.append(child)
         
-        # Critical path estimation
-        max_dependent_depth = 0
-        for task in unscheduled_tasks:
-            # Check depth of task dependencies
-            current_depth = self._calculate_dependency_depth(task, scheduled_tasks)
-            max_dependent_depth = max(max_dependent_depth, current_depth)
+        if len(order) < len(self._names):
+            raise ValueError("Circular dependency or scheduling impossible")
+        return order
+    
+    def _calculate_critical_paths(self) -> np.ndarray:
+        """
+        Calculate, for every task id, the longest chain of durations from the
+        task to the end of the graph in one reverse-topological pass.
+        """
+        indptr = self._child_indptr.tolist()
+        indices = self._child_indices.tolist()
+        cp_length = self._durations.tolist()
+        for task_id in reversed(self._topo_order):
+            start, end = indptr[task_id], indptr[task_id + 1]
+            if start < end:
+                cp_length[task_id] += max(cp_length[indices[k]] for k in range(start, end))
+        return np.array(cp_length, dtype=self._durations.dtype)
+    
+    def _calculate_total_remaining_time(self, duration: int, remaining_duration: int, critical_path: int) -> int:
+        """
+        Heuristic for scheduling a task of length `duration` next:
+        1. Remaining task time once the task is scheduled
+        2. Longest critical path among the tasks still unscheduled after it
+        """
+        return remaining_duration - duration + critical_path
+    
+    def a_star_schedule(self, use_astar: bool = False) -> List[Tuple[str, int, int]]:
+        """
+        Schedule every task, one after another.
         
-        return remaining_time + max_dependent_depth
+        Tasks run serially, so every dependency-respecting order finishes at
+        the same total time and the heuristic cannot change the makespan.
+        By default the order therefore comes from a single critical-path
+        prioritized topological sort; pass `use_astar=True` to run the full
+        A* search instead.
+        """
+        if use_astar:
+            return self._a_star_search()
+        return self._critical_path_schedule()
     
-    def _calculate_dependency_depth(self, task: str, scheduled_tasks: Set[str], depth: int = 0) -> int:
+    def _critical_path_schedule(self) -> List[Tuple[str, int, int]]:
         """
-        Recursively calculate the depth of unscheduled dependencies
-        to estimate the critical path.
+        Kahn topological sort that always emits the ready task with the
+        longest critical path, breaking ties by longer duration, then name.
         """
-        task_obj = self.tasks[task]
+        kernel = _critical_path_schedule_ext or _critical_path_schedule_nb
+        if kernel is not None and self._int64_durations:
+            order, start_times, end_times = kernel(
+                self._durations,
+                self._cp_length,
+                self._name_rank,
+                self._child_indptr,
+                self._child_indices,
+                self._indegree
+            )
+            schedule = [None] * len(self.tasks)
+            for step, (task_id, start_time, end_time) in enumerate(zip(
+                order.tolist(), start_times.tolist(), end_times.tolist()
+            )):
+                task = self.tasks[self._names[task_id]]
+                task.start_time = start_time
+                task.end_time = end_time
+                schedule[step] = (task.name, start_time, end_time)
+            return schedule
+        
+        # The schedule length is known up front, so fill it by index
+        schedule = [None] * len(self.tasks)
+        step = 0
+        current_time = 0
+        indptr = self._child_indptr.tolist()
+        indices = self._child_indices.tolist()
+        indegree = self._indegree.tolist()
+        cp_length = self._cp_length.tolist()
+        durations = self._durations.tolist()
+        names = self._names
         
-        # If all dependencies are scheduled, return current depth
-        if all(dep in scheduled_tasks for dep in task_obj.dependencies):
-            return depth
+        # Must stay identical to `_comes_first` here and in scheduler_core.pyx
+        def priority(task_id: int) -> Tuple[int, int, str, int]:
+            return -cp_length[task_id], -durations[task_id], names[task_id], task_id
         
-        # Find unscheduled dependencies and calculate their depth
-        max_dep_depth = depth
-        for dep in task_obj.dependencies:
-            if dep not in scheduled_tasks:
-                dep_depth = self._calculate_dependency_depth(dep, scheduled_tasks, depth + 1)
-                max_dep_depth = max(max_dep_depth, dep_depth)
+        ready = [priority(task_id) for task_id, count in enumerate(indegree) if count == 0]
+        heapq.heapify(ready)
         
-        return max_dep_depth
+        while ready:
+            task_id = heapq.heappop(ready)[-1]
+            task = self.tasks[self._names[task_id]]
+            
+            # Schedule the task
+            task.start_time = current_time
+            task.end_time = current_time + task.duration
+            schedule[step] = (task.name, task.start_time, task.end_time)
+            step += 1
+            current_time = task.end_time
+            
+            # Release dependents whose last dependency was just scheduled
+            for k in range(indptr[task_id], indptr[task_id + 1]):
+                child_id = indices[k]
+                indegree[child_id] -= 1
+                if indegree[child_id] == 0:
+                    heapq.heappush(ready, priority(child_id))
+        
+        return schedule
     
-    def a_star_schedule(self) -> List[Tuple[str, int, int]]:
+    def _a_star_search(self) -> List[Tuple[str, int, int]]:
         """
         A* scheduling algorithm with advanced heuristic:
-        1. Uses priority queue for task selection
+        1. Picks the ready task with the lowest A* score
         2. Considers dependencies
         3. Minimizes total scheduling time
         """
-        scheduled_tasks = set()
-        schedule = []
+        scheduled = [False] * len(self.tasks)
+        schedule = [None] * len(self.tasks)
         current_time = 0
         
-        # Priority queue to store tasks with their priority
-        task_queue = []
-        
-        while len(scheduled_tasks) < len(self.tasks):
-            # Find tasks ready to be scheduled
-            available_tasks = [
-                task_name 
-                for task_name, task in self.tasks.items() 
-                if task_name not in scheduled_tasks and 
-                all(dep in scheduled_tasks for dep in task.dependencies)
-            ]
-            
-            if not available_tasks:
-                raise ValueError("Circular dependency or scheduling impossible")
-            
-            # Clear previous queue
-            task_queue.clear()
+        # Tasks whose dependencies are all scheduled (Kahn-style frontier)
+        indptr = self._child_indptr.tolist()
+        indices = self._child_indices.tolist()
+        indegree = self._indegree.tolist()
+        durations = self._durations.tolist()
+        names = self._names
+        
+        # Ready tasks as a lazy min-heap on name; scheduled entries are
+        # dropped when they reach the head
+        ready = [(names[task_id], task_id) for task_id, count in enumerate(indegree) if count == 0]
+        heapq.heapify(ready)
+        
+        # Running heuristic state: unscheduled duration and a lazy
+        # max-heap of critical path lengths
+        remaining_duration = sum(durations)
+        cp_heap = [(-cp, task_id) for task_id, cp in enumerate(self._cp_length.tolist())]
+        heapq.heapify(cp_heap)
+        
+        for step in range(len(self.tasks)):
+            # Longest unscheduled critical path, and the runner-up for when
+            # the candidate itself is the task on that path
+            top_cp, top_task = heapq.heappop(cp_heap)
+            while cp_heap and scheduled[cp_heap[0][1]]:
+                heapq.heappop(cp_heap)
+            runner_up_cp = -cp_heap[0][0] if cp_heap else 0
+            heapq.heappush(cp_heap, (top_cp, top_task))
             
-            # Evaluate and prioritize available tasks
-            for task_name in available_tasks:
-                # Calculate A* score
-                task = self.tasks[task_name]
-                
+            def f_score(task_id: int, critical_path: int) -> int:
                 # F(n) = G(n) + H(n)
                 # G(n): Current time to start task
                 # H(n): Estimated remaining time with heuristic
                 g_score = current_time
-                h_score = self._calculate_total_remaining_time(scheduled_tasks | {task_name})
-                f_score = g_score + h_score + task.duration
-                
-                # Lower score means higher priority
-                heapq.heappush(task_queue, (f_score, task_name))
+                duration = durations[task_id]
+                h_score = self._calculate_total_remaining_time(
+                    duration, remaining_duration, critical_path
+                )
+                return g_score + h_score + duration
             
-            # Select the task with lowest A* score
-            _, best_task = heapq.heappop(task_queue)
-            task = self.tasks[best_task]
+            # Every ready task except `top_task` leaves the longest critical
+            # path unscheduled, so they all share one score and the first by
+            # name wins among them. Only `top_task` can score lower, so
+            # comparing it with the head of the name heap picks the task
+            # with the lowest A* score (ties broken by name) without a scan.
+            while scheduled[ready[0][1]]:
+                heapq.heappop(ready)
+            best_task = ready[0][1]
+            if best_task != top_task and indegree[top_task] == 0:
+                if f_score(top_task, runner_up_cp) < f_score(best_task, -top_cp):
+                    best_task = top_task
+            
+            task = self.tasks[self._names[best_task]]
             
             # Schedule the task
             task.start_time = current_time
             task.end_time = current_time + task.duration
             
-            schedule.append((task.name, task.start_time, task.end_time))
-            scheduled_tasks.add(best_task)
+            schedule[step] = (task.name, task.start_time, task.end_time)
+            scheduled[best_task] = True
+            remaining_duration -= task.duration
+            while cp_heap and scheduled[cp_heap[0][1]]:
+                heapq.heappop(cp_heap)
+            
+            # Release dependents whose last dependency was just scheduled
+            for k in range(indptr[best_task], indptr[best_task + 1]):
+                child_id = indices[k]
+                indegree[child_id] -= 1
+                if indegree[child_id] == 0:
+                    heapq.heappush(ready, (names[child_id], child_id))
             
             # Update current time
             current_time = task.end_time
         
         return schedule
 
+def _jit(func):
+    """Compile `func` with numba when it is installed."""
+    return njit(cache=True)(func) if njit is not None else func
+
+@_jit
+def _comes_first(a, b, durations, cp_length, name_rank):
+    """Longest critical path first, then longer duration, then name."""
+    # Must stay identical to `priority()` in
+    # `AStarTaskScheduler._critical_path_schedule` and to `_comes_first` in
+    # scheduler_core.pyx, or the scheduling backends disagree
+    if cp_length[a] != cp_length[b]:
+        return cp_length[a] > cp_length[b]
+    if durations[a] != durations[b]:
+        return durations[a] > durations[b]
+    return name_rank[a] < name_rank[b]
+
+@_jit
+def _heap_push(heap, size, task_id, durations, cp_length, name_rank):
+    """Sift `task_id` up into the array heap of `size` items."""
+    pos = size
+    while pos > 0:
+        parent = (pos - 1) // 2
+        if not _comes_first(task_id, heap[parent], durations, cp_length, name_rank):
+            break
+        heap[pos] = heap[parent]
+        pos = parent
+    heap[pos] = task_id
+
+@_jit
+def _heap_pop(heap, size, durations, cp_length, name_rank):
+    """Remove and return the first task of the array heap of `size` items."""
+    top = heap[0]
+    size -= 1
+    last = heap[size]
+    pos = 0
+    while True:
+        child = 2 * pos + 1
+        if child >= size:
+            break
+        if child + 1 < size and _comes_first(heap[child + 1], heap[child], durations, cp_length, name_rank):
+            child += 1
+        if not _comes_first(heap[child], last, durations, cp_length, name_rank):
+            break
+        heap[pos] = heap[child]
+        pos = child
+    heap[pos] = last
+    return top
+
+def _critical_path_schedule_kernel(durations, cp_length, name_rank, indptr, indices, indegree):
+    """
+    Array version of `AStarTaskScheduler._critical_path_schedule`, written
+    so numba can compile it. `indptr`/`indices` hold each task's dependents
+    in CSR form. Returns the scheduled task ids with their start and end times.
+    """
+    n = durations.shape[0]
+    indegree = indegree.copy()
+    ready = np.empty(n, dtype=np.int64)
+    n_ready = 0
+    for task_id in range(n):
+        if indegree[task_id] == 0:
+            _heap_push(ready, n_ready, task_id, durations, cp_length, name_rank)
+            n_ready += 1
+    
+    order = np.empty(n, dtype=np.int64)
+    start_times = np.empty(n, dtype=np.int64)
+    end_times = np.empty(n, dtype=np.int64)
+    current_time = 0
+    
+    for step in range(n):
+        task_id = _heap_pop(ready, n_ready, durations, cp_length, name_rank)
+        n_ready -= 1
+        
+        order[step] = task_id
+        start_times[step] = current_time
+        current_time += durations[task_id]
+        end_times[step] = current_time
+        
+        # Release dependents whose last dependency was just scheduled
+        for k in range(indptr[task_id], indptr[task_id + 1]):
+            child = indices[k]
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                _heap_push(ready, n_ready, child, durations, cp_length, name_rank)
+                n_ready += 1
+    
+    return order, start_times, end_times
+
+# The uncompiled kernel would only be slower than the heap-based Python
+# loop, so the fast path is exposed only when numba is installed
+_critical_path_schedule_nb = _jit(_critical_path_schedule_kernel) if njit is not None else None
+
 # Example task creation function
 def create_example_tasks():
     return [
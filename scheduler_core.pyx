@@ -0,0 +1,127 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled critical-path scheduling loop for `AStarTaskScheduler`.
+
+Build in place with `python setup.py build_ext --inplace`.
+"""
+import numpy as np
+from libc.stdint cimport int32_t, int64_t
+
+
+cdef inline bint _comes_first(
+    int32_t a,
+    int32_t b,
+    const int64_t[::1] durations,
+    const int64_t[::1] cp_length,
+    const int64_t[::1] name_rank
+) noexcept nogil:
+    """Longest critical path first, then longer duration, then name."""
+    # Must stay identical to `priority()` in
+    # `AStarTaskScheduler._critical_path_schedule` and to `_comes_first` in
+    # a_star_task_scheduler.py, or the scheduling backends disagree
+    if cp_length[a] != cp_length[b]:
+        return cp_length[a] > cp_length[b]
+    if durations[a] != durations[b]:
+        return durations[a] > durations[b]
+    return name_rank[a] < name_rank[b]
+
+
+cdef inline void _heap_push(
+    int32_t[::1] heap,
+    Py_ssize_t size,
+    int32_t task_id,
+    const int64_t[::1] durations,
+    const int64_t[::1] cp_length,
+    const int64_t[::1] name_rank
+) noexcept nogil:
+    """Sift `task_id` up into the array heap of `size` items."""
+    cdef Py_ssize_t pos = size, parent
+    while pos > 0:
+        parent = (pos - 1) // 2
+        if not _comes_first(task_id, heap[parent], durations, cp_length, name_rank):
+            break
+        heap[pos] = heap[parent]
+        pos = parent
+    heap[pos] = task_id
+
+
+cdef inline int32_t _heap_pop(
+    int32_t[::1] heap,
+    Py_ssize_t size,
+    const int64_t[::1] durations,
+    const int64_t[::1] cp_length,
+    const int64_t[::1] name_rank
+) noexcept nogil:
+    """Remove and return the first task of the array heap of `size` items."""
+    cdef int32_t top = heap[0]
+    cdef int32_t last
+    cdef Py_ssize_t pos = 0, child
+    size -= 1
+    last = heap[size]
+    while True:
+        child = 2 * pos + 1
+        if child >= size:
+            break
+        if child + 1 < size and _comes_first(heap[child + 1], heap[child], durations, cp_length, name_rank):
+            child += 1
+        if not _comes_first(heap[child], last, durations, cp_length, name_rank):
+            break
+        heap[pos] = heap[child]
+        pos = child
+    heap[pos] = last
+    return top
+
+
+cpdef tuple schedule(
+    const int64_t[::1] durations,
+    const int64_t[::1] cp_length,
+    const int64_t[::1] name_rank,
+    const int32_t[::1] indptr,
+    const int32_t[::1] indices,
+    const int32_t[::1] indegree
+):
+    """
+    Kahn topological sort that always emits the ready task with the longest
+    critical path, breaking ties by longer duration, then name.
+    `indptr`/`indices` hold each task's dependents in CSR form. Returns the
+    scheduled task ids with their start and end times.
+    """
+    cdef Py_ssize_t n = durations.shape[0]
+    cdef Py_ssize_t n_ready = 0, step, k
+    cdef int32_t task_id, child
+    cdef int64_t current_time = 0
+
+    remaining = np.array(indegree, dtype=np.int32)
+    ready_arr = np.empty(n, dtype=np.int32)
+    order_arr = np.empty(n, dtype=np.int64)
+    start_arr = np.empty(n, dtype=np.int64)
+    end_arr = np.empty(n, dtype=np.int64)
+    cdef int32_t[::1] pending = remaining
+    cdef int32_t[::1] ready = ready_arr
+    cdef int64_t[::1] order = order_arr
+    cdef int64_t[::1] start_times = start_arr
+    cdef int64_t[::1] end_times = end_arr
+
+    for task_id in range(n):
+        if pending[task_id] == 0:
+            _heap_push(ready, n_ready, task_id, durations, cp_length, name_rank)
+            n_ready += 1
+
+    for step in range(n):
+        task_id = _heap_pop(ready, n_ready, durations, cp_length, name_rank)
+        n_ready -= 1
+
+        order[step] = task_id
+        start_times[step] = current_time
+        current_time += durations[task_id]
+        end_times[step] = current_time
+
+        # Release dependents whose last dependency was just scheduled
+        for k in range(indptr[task_id], indptr[task_id + 1]):
+            child = indices[k]
+            pending[child] -= 1
+            if pending[child] == 0:
+                _heap_push(ready, n_ready, child, durations, cp_length, name_rank)
+                n_ready += 1
+
+    return order_arr, start_arr, end_arr
@@ -0,0 +1,16 @@
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    raise SystemExit(
+        "Building the optional scheduler_core extension requires Cython: "
+        "pip install cython"
+    )
+
+# Optional compiled scheduling core: python setup.py build_ext --inplace
+setup(
+    name="a_star_task_scheduler",
+    py_modules=["a_star_task_scheduler"],
+    ext_modules=cythonize("scheduler_core.pyx"),
+)
@@ -1,5 +1,4 @@
 import streamlit as st
-import pandas as pd
 import plotly.figure_factory as ff
 from a_star_task_scheduler import Task, AStarTaskScheduler
 
@@ -49,40 +48,39 @@ def main():
             } 
             for task in st.session_state.tasks
         ]
-        df = pd.DataFrame(task_data)
-        st.sidebar.dataframe(df)
+        st.sidebar.table(task_data)
     
     # Main area for scheduling and results
     st.header("🚀 Scheduling Results")
     
     # Scheduling section
-    if st.button("Run A* Scheduling"):
+    if st.button("Run Scheduling"):
         if st.session_state.tasks:
             try:
-                # Initialize scheduler
-                scheduler = AStarTaskScheduler(st.session_state.tasks)
-                
-                # Perform A* scheduling
-                schedule = scheduler.a_star_schedule()
+                # Schedule in critical-path order (cached on the task definitions)
+                schedule = run_schedule(tuple(
+                    (task.name, task.duration, tuple(task.dependencies))
+                    for task in st.session_state.tasks
+                ))
                 
                 # Display scheduling results
-                results_df = pd.DataFrame(
-                    schedule, 
-                    columns=["Task", "Start Time", "End Time"]
-                )
+                results = [
+                    {"Task": task, "Start Time": start, "End Time": end}
+                    for task, start, end in schedule
+                ]
                 
                 # Metrics
                 col1, col2, col3 = st.columns(3)
                 with col1:
                     st.metric("Total Tasks", len(schedule))
                 with col2:
-                    st.metric("Total Time", results_df['End Time'].max())
+                    st.metric("Total Time", max(end for _, _, end in schedule))
                 with col3:
-                    st.metric("Earliest Finish", results_df['End Time'].min())
+                    st.metric("Earliest Finish", min(end for _, _, end in schedule))
                 
                 # Results table
                 st.subheader("Scheduling Details")
-                st.dataframe(results_df)
+                st.dataframe(results)
                 
                 # Gantt Chart
                 st.subheader("📊 Task Timeline")
@@ -94,8 +92,18 @@ def main():
         else:
             st.warning("Please add tasks before scheduling")
 
+@st.cache_data(show_spinner=False)
+def run_schedule(task_specs):
+    """Schedule tasks given as (name, duration, dependencies) tuples."""
+    tasks = [Task(name, duration, list(deps)) for name, duration, deps in task_specs]
+    return AStarTaskScheduler(tasks).a_star_schedule()
+
 def create_gantt_chart(schedule):
     """Create an interactive Gantt chart for task schedule."""
+    return _create_gantt_chart(tuple(schedule))
+
+@st.cache_data(show_spinner=False)
+def _create_gantt_chart(schedule):
     df = []
     for task, start, end in schedule:
         df.append(dict(Task=task, Start=start, Finish=end))
@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+import a_star_task_scheduler as scheduler_module
+from a_star_task_scheduler import Task, AStarTaskScheduler, create_example_tasks
+
+# (compiled extension, numba kernel) each backend installs for the default path
+BACKENDS = {
+    "python": lambda: (None, None),
+    "kernel": lambda: (None, scheduler_module._critical_path_schedule_kernel),
+    "numba": lambda: (None, scheduler_module._critical_path_schedule_nb),
+    "cython": lambda: (scheduler_module._critical_path_schedule_ext, None),
+}
+
+def random_tasks(rng, n):
+    tasks = []
+    for i in range(n):
+        deps = [f"T{j}" for j in range(i) if rng.random() < 0.15]
+        rng.shuffle(deps)
+        tasks.append(Task(f"T{i}", rng.randint(1, 9), deps))
+    rng.shuffle(tasks)
+    return tasks
+
+def assert_valid(tasks, schedule):
+    position = {name: i for i, (name, _, _) in enumerate(schedule)}
+    assert sorted(position) == sorted(task.name for task in tasks)
+    current_time = 0
+    for _, start, end in schedule:
+        assert start == current_time
+        current_time = end
+    for task in tasks:
+        for dep in task.dependencies:
+            assert position[dep] < position[task.name]
+
+@pytest.fixture(params=list(BACKENDS))
+def backend(request, monkeypatch):
+    ext, nb = BACKENDS[request.param]()
+    if request.param in ("numba", "cython") and (ext or nb) is None:
+        pytest.skip(f"{request.param} backend is not available")
+    monkeypatch.setattr(scheduler_module, "_critical_path_schedule_ext", ext)
+    monkeypatch.setattr(scheduler_module, "_critical_path_schedule_nb", nb)
+    return request.param
+
+def reference_schedule(tasks, monkeypatch):
+    with monkeypatch.context() as patch:
+        patch.setattr(scheduler_module, "_critical_path_schedule_ext", None)
+        patch.setattr(scheduler_module, "_critical_path_schedule_nb", None)
+        return AStarTaskScheduler(tasks).a_star_schedule()
+
+def test_backends_match_python_schedule(backend, monkeypatch):
+    rng = random.Random(0)
+    for _ in range(100):
+        tasks = random_tasks(rng, rng.randint(0, 40))
+        schedule = AStarTaskScheduler(tasks).a_star_schedule()
+        assert_valid(tasks, schedule)
+        assert schedule == reference_schedule(tasks, monkeypatch)
+
+def test_backends_schedule_example(backend):
+    schedule = AStarTaskScheduler(create_example_tasks()).a_star_schedule()
+    assert schedule == [
+        ("Design", 0, 3),
+        ("Backend", 3, 8),
+        ("Frontend", 8, 12),
+        ("Database", 12, 15),
+        ("Testing", 15, 17),
+    ]
+
+def test_a_star_search_respects_dependencies():
+    rng = random.Random(1)
+    for _ in range(50):
+        tasks = random_tasks(rng, rng.randint(0, 30))
+        assert_valid(tasks, AStarTaskScheduler(tasks).a_star_schedule(use_astar=True))
+
+def test_circular_dependency_raises():
+    with pytest.raises(ValueError, match="Circular dependency"):
+        AStarTaskScheduler([Task("A", 1, ["B"]), Task("B", 1, ["A"])])
+
+@pytest.mark.parametrize("durations", [(2.5, 1.0), (2**63, 1)])
+def test_non_int64_durations_schedule_on_every_backend(backend, durations):
+    first, second = durations
+    tasks = [Task("A", first), Task("B", second, ["A"])]
+    assert AStarTaskScheduler(tasks).a_star_schedule() == [
+        ("A", 0, first),
+        ("B", first, first + second),
+    ]